@@ -1,2 +1,4 @@
+from .core import Collation
 from .core import tidy_file
+from .core import tidy_files_async
 from .core import tidy_lines
@@ -1,9 +1,11 @@
+import asyncio
 import pathlib
 import typing
 
 import typer
 
-from gitignore_tidy.core import tidy_file
+from gitignore_tidy.core import Collation
+from gitignore_tidy.core import tidy_files_async
 
 
 app = typer.Typer()
@@ -23,10 +25,26 @@ def tidy_files(
         False,
         help="Whether or not to allow trailing whitespaces in file names",
     ),
+    collation: Collation = typer.Option(
+        Collation.lexical,
+        help="Order in which entries within a section are sorted",
+    ),
+    io_concurrency: int = typer.Option(
+        1,
+        min=1,
+        help="Maximum number of files processed concurrently. Values above 1 help on high-latency filesystems",
+    ),
 ):
     """
     Tidy .gitignore files
     """
     if files is None or len(files) < 1:
         files = [pathlib.Path(".gitignore")]
-    [tidy_file(file, allow_leading_whitespace=allow_leading_whitespace) for file in files]
+    asyncio.run(
+        tidy_files_async(
+            files,
+            io_concurrency=io_concurrency,
+            allow_leading_whitespace=allow_leading_whitespace,
+            collation=collation,
+        ),
+    )
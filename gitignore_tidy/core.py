@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import asyncio
 import collections.abc
 import dataclasses
+import enum
 import itertools
 import pathlib
 import re
@@ -17,13 +19,46 @@ else:
     from typing import Self  # noqa: F401
 
 
-def tidy_file(path: pathlib.Path, *, allow_leading_whitespace: bool = False) -> None:
+class Collation(str, enum.Enum):
+    """
+    Order in which entries within a section are sorted
+    """
+
+    lexical = "lexical"
+    case_insensitive = "case-insensitive"
+    directories_first = "directories-first"
+    natural = "natural"
+
+
+_digits_pattern: re.Pattern = re.compile(r"(\d+)")
+
+
+def _natural_key(line: str) -> tuple[str | int, ...]:
+    # splitting on a capturing group alternates str and digit parts, starting with a str part, so parts
+    # at the same position always have the same type and compare fine.
+    return tuple(int(part) if idx % 2 else part for idx, part in enumerate(re.split(_digits_pattern, line)))
+
+
+_COLLATION_KEYS: dict[Collation, collections.abc.Callable[[str], typing.Any]] = {
+    Collation.lexical: lambda line: line,
+    Collation.case_insensitive: str.casefold,
+    Collation.directories_first: lambda line: (not line.endswith("/"), line),
+    Collation.natural: _natural_key,
+}
+
+
+def tidy_file(
+    path: pathlib.Path,
+    *,
+    allow_leading_whitespace: bool = False,
+    collation: Collation = Collation.lexical,
+) -> None:
     lines = PlainLines.from_file(path)
     if len(lines) < 1:
         logger.info("File %s is empty, not writing.", path)
         return
 
-    tidy_plain_lines = tidy_lines(lines, allow_leading_whitespace=allow_leading_whitespace)
+    tidy_plain_lines = tidy_lines(lines, allow_leading_whitespace=allow_leading_whitespace, collation=collation)
     if lines.lines == tidy_plain_lines.lines:
         logger.info("%s already tidy.", path)  # TODO use logger module
     else:
@@ -31,9 +66,45 @@ def tidy_file(path: pathlib.Path, *, allow_leading_whitespace: bool = False) ->
         logger.info("Successfully written %s.", path)
 
 
-def tidy_lines(lines: PlainLines, allow_leading_whitespace: bool) -> PlainLines:
+async def tidy_files_async(
+    paths: collections.abc.Iterable[pathlib.Path],
+    *,
+    io_concurrency: int = 1,
+    allow_leading_whitespace: bool = False,
+    collation: Collation = Collation.lexical,
+) -> None:
+    """
+    Tidy files concurrently, with at most `io_concurrency` in flight and paths to the same file tidied once.
+    """
+    if io_concurrency < 1:
+        raise ValueError("`io_concurrency` must be at least 1.")
+    semaphore = asyncio.Semaphore(io_concurrency)
+
+    async def tidy(path: pathlib.Path) -> None:
+        async with semaphore:
+            await asyncio.to_thread(
+                tidy_file,
+                path,
+                allow_leading_whitespace=allow_leading_whitespace,
+                collation=collation,
+            )
+
+    paths = list(paths)
+    # resolving touches the filesystem, so it happens in worker threads rather than on the event loop.
+    resolved = await asyncio.gather(*(asyncio.to_thread(path.resolve) for path in paths))
+    unique: dict[pathlib.Path, pathlib.Path] = {}
+    for key, path in zip(resolved, paths):
+        unique.setdefault(key, path)
+    await asyncio.gather(*(tidy(path) for path in unique.values()))
+
+
+def tidy_lines(
+    lines: PlainLines,
+    allow_leading_whitespace: bool,
+    collation: Collation = Collation.lexical,
+) -> PlainLines:
     normalised_contents = lines.normalize(allow_leading_whitespace=allow_leading_whitespace)
-    sorted_sections = Sections(tuple(section.sort() for section in normalised_contents.split()))
+    sorted_sections = Sections(tuple(section.sort(collation) for section in normalised_contents.split()))
     return sorted_sections.as_plain()
 
 
@@ -139,10 +210,10 @@ class Section:
     def sorted(self) -> bool:
         return self.lines.sorted
 
-    def sort(self) -> Section:
+    def sort(self, collation: Collation = Collation.lexical) -> Section:
         return Section(
             self.header,
-            PlainLines(self._sort(self.lines.lines), normalised=True, sorted=True),
+            PlainLines(self._sort(self.lines.lines, collation), normalised=True, sorted=True),
             self.trailing_blanks,
         )
 
@@ -156,19 +227,18 @@ class Section:
         return iter(elements)
 
     @staticmethod
-    def _sort(lines: collections.abc.Sequence[str]) -> tuple[str]:
-        original = lines
-        non_negated = [re.sub("^!", "", line) for line in lines]
-        sorted_non_negated = sorted(non_negated)
-        sorted_negated = []
-        for line in sorted_non_negated:
-            negated_cand = "!" + line
-            if negated_cand in original:
-                sorted_negated.append(negated_cand)
-            else:
-                sorted_negated.append(line)
-
-        return tuple(sorted_negated)
+    def _sort(lines: collections.abc.Sequence[str], collation: Collation = Collation.lexical) -> tuple[str, ...]:
+        # decorate each line once with its key, computed on the pattern without negation, so a negating entry
+        # lands right after the entry it negates. Ties are broken by the pattern itself to keep the output
+        # deterministic for collations that consider distinct patterns equal.
+        key = _COLLATION_KEYS[collation]
+        decorated = []
+        for line in lines:
+            negated = line.startswith("!")
+            pattern = line[1:] if negated else line
+            decorated.append((key(pattern), pattern, negated, line))
+        decorated.sort()
+        return tuple(line for *_, line in decorated)
 
 
 @dataclasses.dataclass(frozen=True)
@@ -1,3 +1,6 @@
+import pathlib
+
+import pytest
 from typer.testing import CliRunner
 
 from gitignore_tidy.cli import app
@@ -16,3 +19,34 @@ class TestCLI(TestTidyFile):
 
         result = runner.invoke(app, [str(path_first), str(path_second)])
         assert result.exit_code == 0
+
+    def test_collation(self, temp_dir):
+        path = self.write(temp_dir, contents="build10\nbuild2\n")
+
+        result = runner.invoke(app, [str(path), "--collation", "natural"])
+        assert result.exit_code == 0
+        assert path.read_text() == "build2\nbuild10\n"
+
+    def test_io_concurrency(self, temp_dir, untidy_contents, tidy_contents):
+        paths = [self.write(temp_dir / str(idx), contents=untidy_contents) for idx in range(3)]
+
+        result = runner.invoke(app, [*map(str, paths), "--io-concurrency", "2"])
+        assert result.exit_code == 0
+        assert all(path.read_text() == tidy_contents for path in paths)
+
+    def test_io_concurrency_bounded(self, monkeypatch, temp_dir):
+        calls = self._record_concurrency(monkeypatch)
+        paths = [pathlib.Path(temp_dir, str(idx)) for idx in range(6)]
+
+        result = runner.invoke(app, [*map(str, paths), "--io-concurrency", "3"])
+        assert result.exit_code == 0
+        assert 1 < max(running for _, running in calls) <= 3
+
+    @pytest.mark.parametrize("io_concurrency", ("1", "2"))
+    def test_duplicates(self, monkeypatch, temp_dir, io_concurrency):
+        calls = self._record_concurrency(monkeypatch)
+        path = pathlib.Path(temp_dir, ".gitignore")
+
+        result = runner.invoke(app, [str(path), str(path), "--io-concurrency", io_concurrency])
+        assert result.exit_code == 0
+        assert [path for path, _ in calls] == [path]
@@ -1,13 +1,20 @@
+import asyncio
+import os
 import pathlib
 import re
 import tempfile
+import threading
+import time
 
 import pytest
 
+import gitignore_tidy.core
+from gitignore_tidy.core import Collation
 from gitignore_tidy.core import PlainLines
 from gitignore_tidy.core import Section
 from gitignore_tidy.core import Sections
 from gitignore_tidy.core import tidy_file
+from gitignore_tidy.core import tidy_files_async
 from gitignore_tidy.core import tidy_lines
 
 
@@ -61,6 +68,74 @@ class TestTidyFile:
             caplog.text,
         )
 
+    def test_async(self, caplog, temp_dir, untidy_contents, tidy_contents):
+        paths = [self.write(temp_dir / str(idx), contents=untidy_contents) for idx in range(5)]
+
+        asyncio.run(tidy_files_async(paths, io_concurrency=2))
+        assert all(path.read_text() == tidy_contents for path in paths)
+        assert len(re.findall("Successfully written", caplog.text)) == len(paths)
+
+    @staticmethod
+    def _record_concurrency(monkeypatch) -> list[tuple[pathlib.Path, int]]:
+        lock = threading.Lock()
+        running = [0]
+        calls = []
+
+        def tidy_file(path, **kwargs):
+            with lock:
+                running[0] += 1
+                calls.append((path, running[0]))
+            time.sleep(0.05)
+            with lock:
+                running[0] -= 1
+
+        monkeypatch.setattr(gitignore_tidy.core, "tidy_file", tidy_file)
+        return calls
+
+    @pytest.mark.parametrize("io_concurrency", (2, 4))
+    def test_async_concurrency(self, monkeypatch, temp_dir, io_concurrency):
+        calls = self._record_concurrency(monkeypatch)
+        paths = [pathlib.Path(temp_dir, str(idx)) for idx in range(8)]
+
+        asyncio.run(tidy_files_async(paths, io_concurrency=io_concurrency))
+        assert [path for path, _ in calls] == paths
+        assert 1 < max(running for _, running in calls) <= io_concurrency
+
+    def test_async_duplicates(self, monkeypatch, temp_dir):
+        calls = self._record_concurrency(monkeypatch)
+        path = pathlib.Path(temp_dir, ".gitignore")
+        relative = pathlib.Path(os.path.relpath(path))
+
+        asyncio.run(tidy_files_async([path, relative, path, temp_dir / "other"], io_concurrency=4))
+        assert [path for path, _ in calls] == [path, temp_dir / "other"]
+
+    def test_async_resolve_off_loop(self, monkeypatch, temp_dir):
+        self._record_concurrency(monkeypatch)
+        lock = threading.Lock()
+        running = [0]
+        calls = []
+
+        def resolve(path):
+            with lock:
+                running[0] += 1
+                calls.append((threading.current_thread(), running[0]))
+            time.sleep(0.05)
+            with lock:
+                running[0] -= 1
+            return pathlib.Path(os.path.realpath(path))
+
+        monkeypatch.setattr(pathlib.Path, "resolve", resolve)
+        paths = [pathlib.Path(temp_dir, str(idx)) for idx in range(4)]
+
+        asyncio.run(tidy_files_async(paths))
+        assert len(calls) == len(paths)
+        assert all(thread is not threading.main_thread() for thread, _ in calls)
+        assert max(running for _, running in calls) > 1
+
+    def test_async_invalid_concurrency(self, temp_dir):
+        with pytest.raises(ValueError, match="at least 1"):
+            asyncio.run(tidy_files_async([], io_concurrency=0))
+
     def test_empty(self, caplog, temp_dir):
 
         path_first = self.write(temp_dir, contents="")
@@ -150,6 +225,40 @@ class TestSection:
             sorted=True,
         )
 
+    @pytest.mark.parametrize(
+        ("input", "collation", "expected_output"),
+        (
+            pytest.param(
+                ["b", "!a/b", "a", "!a"],
+                Collation.lexical,
+                ("a", "!a", "!a/b", "b"),
+                id="lexical, negation of same pattern",
+            ),
+            pytest.param(
+                ["b", "C", "a", "!B/x"],
+                Collation.case_insensitive,
+                ("a", "b", "!B/x", "C"),
+                id="case-insensitive",
+            ),
+            pytest.param(
+                ["z", "b/", "a", "!a/"],
+                Collation.directories_first,
+                ("!a/", "b/", "a", "z"),
+                id="directories first",
+            ),
+            pytest.param(
+                ["build10", "build2", "!build2/x", "build"],
+                Collation.natural,
+                ("build", "build2", "!build2/x", "build10"),
+                id="natural",
+            ),
+        ),
+    )
+    def test_sort_collation(self, input, collation, expected_output):
+        assert _create_section_from_normalised(header=None, lines=input).sort(collation) == (
+            _create_section_from_normalised(header=None, lines=expected_output, sorted=True)
+        )
+
     @pytest.mark.parametrize(
         ("input", "expected_output"),
         (
@@ -407,3 +516,11 @@ class TestTidyLines:
     )
     def test_complete(self, input, expected_output):
         assert self.tidy_lines(input) == expected_output
+
+    def test_collation(self):
+        lines = tidy_lines(
+            PlainLines(["# s", "x10", "x2", "x1"]),
+            allow_leading_whitespace=False,
+            collation=Collation.natural,
+        )
+        assert list(lines) == ["# s", "x1", "x2", "x10"]